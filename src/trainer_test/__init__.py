@@ -1,8 +1,16 @@
 from .audio_service import play_audio
-from .image_service import find_image, find_image_in_center_region, crop_center_region
+from .image_service import (
+    crop_center_array,
+    crop_center_region,
+    find_image,
+    find_image_array,
+    find_image_in_center_region,
+    preload_needles,
+)
 from .keyboard_service import press_key, tap
 from .mouse_service import click, jitter, move_by, move_to, position, right_click
-from .screenshot_service import capture_screenshot
+from .ocr_service import image_to_text
+from .screenshot_service import capture_screenshot, capture_screenshot_array
 from .window_service import (
     WindowInfo,
     find_window_info,
@@ -14,7 +22,10 @@ from .window_service import (
 __all__ = [
     "play_audio",
     "find_image",
+    "find_image_array",
     "find_image_in_center_region",
+    "preload_needles",
+    "crop_center_array",
     "crop_center_region",
     "press_key",
     "tap",
@@ -25,6 +36,8 @@ __all__ = [
     "position",
     "jitter",
     "capture_screenshot",
+    "capture_screenshot_array",
+    "image_to_text",
     "WindowInfo",
     "find_window_info",
     "focus_window",
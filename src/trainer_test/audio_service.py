@@ -1,23 +1,49 @@
 from __future__ import annotations
 
 import logging
+import sys
+import threading
 from pathlib import Path
 
 from playsound import playsound
 
+if sys.platform == "win32":
+    import winsound
+else:
+    winsound = None
+
 LOGGER = logging.getLogger(__name__)
 
 
+def _play_in_background(path: Path) -> None:
+    """Run the blocking ``playsound`` call on a daemon thread."""
+    def _run() -> None:
+        try:
+            playsound(str(path))
+        except Exception:
+            LOGGER.exception("Unable to play audio: %s", path)
+
+    threading.Thread(target=_run, name="audio-playback", daemon=True).start()
+
+
 def play_audio(file_path: str | Path) -> None:
-    """Play an audio file using playsound."""
+    """Start playing an audio file and return immediately.
+
+    WAV files on Windows go straight to ``winsound`` asynchronously; anything else
+    (the bundled cues are MP3) is handed to ``playsound`` on a background thread.
+    """
     path = Path(file_path)
     if not path.exists():
         LOGGER.warning("Audio file not found: %s", path)
         return
 
     LOGGER.debug("Playing audio: %s", path)
-    playsound(str(path))
+    if winsound is not None and path.suffix.lower() == ".wav":
+        winsound.PlaySound(
+            str(path), winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+        )
+        return
+    _play_in_background(path)
 
 
 __all__ = ["play_audio"]
-
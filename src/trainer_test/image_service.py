@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import logging
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import cv2
+import numpy as np
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,21 +27,240 @@ DEFAULT_NEEDLE_PATH = DEFAULT_IMAGE_DIR / "test-find.png"
 DEFAULT_HAYSTACK_PATH = DEFAULT_IMAGE_DIR / "test-screenshot.png"
 DEFAULT_OUTPUT_PATH = DEFAULT_IMAGE_DIR / "finded.png"
 
-
-def _resolve_path(path: str | Path) -> Path:
+# Inputs are always 8-bit grayscale. OpenCV already correlates through DFT tiles on
+# the CPU, so large needles need no separate FFT path. Every pyramid level uses this
+# brightness/contrast-invariant score; a non-invariant coarse metric can anchor the
+# refinement on the wrong spot.
+MATCH_METHOD = cv2.TM_CCOEFF_NORMED
+# Up to this many pyrDown halvings; each level stops once the needle's short side would
+# drop below COARSE_MIN_NEEDLE_SIDE.
+PYRAMID_MAX_LEVELS = 2
+PYRAMID_REFINE_PADDING = 4
+COARSE_MIN_NEEDLE_SIDE = 8
+# Smaller haystacks get one full-resolution search: with the fallback, the pyramid only
+# wins on hits, and below roughly 500x500 even those savings are small.
+PYRAMID_MIN_HAYSTACK_PIXELS = 250_000
+CROP_PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+# Below this haystack size the upload to the OpenCL device costs more than it saves.
+OCL_MIN_HAYSTACK_PIXELS = 1_000_000
+
+_OCL_OK = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_path_cached(path: str) -> Path:
     resolved = Path(path).expanduser()
     if not resolved.is_absolute():
         resolved = (PROJECT_ROOT / resolved).resolve()
     return resolved
 
 
-def _load_image(path: Path) -> Any:
-    image = cv2.imread(str(path), cv2.IMREAD_COLOR)
+def _resolve_path(path: str | Path) -> Path:
+    return _resolve_path_cached(str(path))
+
+
+def _load_image(path: Path, flags: int = cv2.IMREAD_COLOR) -> Any:
+    image = cv2.imread(str(path), flags)
     if image is None:
         raise FileNotFoundError(f"Unable to read image at {path}")
     return image
 
 
+@dataclass(frozen=True)
+class _NeedleTemplate:
+    """Grayscale needle plus the derived data each search would otherwise recompute."""
+
+    gray: Any
+    levels: tuple[Any, ...] = ()  # pyrDown halvings of `gray`, finest first
+    gray_umat: Any | None = None  # `gray` already uploaded for OpenCL, when available
+
+    @property
+    def coarse(self) -> Any | None:
+        """Coarsest pyramid level, or None when the needle is too small for a pyramid."""
+        return self.levels[-1] if self.levels else None
+
+    @property
+    def width(self) -> int:
+        return self.gray.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.gray.shape[0]
+
+
+def _prepare_needle(gray: Any) -> _NeedleTemplate:
+    levels: list[Any] = []
+    current = gray
+    while len(levels) < PYRAMID_MAX_LEVELS and min(current.shape[:2]) // 2 >= COARSE_MIN_NEEDLE_SIDE:
+        current = cv2.pyrDown(current)
+        levels.append(current)
+    gray_umat = cv2.UMat(gray) if _OCL_OK else None
+    return _NeedleTemplate(gray=gray, levels=tuple(levels), gray_umat=gray_umat)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_needle(path_str: str, mtime_ns: int) -> _NeedleTemplate:
+    """Decode a needle once per file version; `mtime_ns` only takes part in the cache key."""
+    needle = _prepare_needle(_load_image(Path(path_str), cv2.IMREAD_GRAYSCALE))
+    # Shared between callers, so guard against accidental in-place edits.
+    for image in (needle.gray, *needle.levels):
+        image.flags.writeable = False
+    return needle
+
+
+def _load_needle(path: Path) -> _NeedleTemplate:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Unable to read image at {path}") from None
+    return _cached_needle(str(path), mtime_ns)
+
+
+def _match_template(
+    haystack: Any,
+    needle: Any,
+    method: int = MATCH_METHOD,
+    needle_umat: Any | None = None,
+) -> tuple[float, tuple[int, int]]:
+    """Run matchTemplate and return (confidence, top_left) where higher confidence is better.
+
+    Large haystacks go through ``cv2.UMat`` so OpenCV can use its OpenCL path when available;
+    `needle_umat` lets cached needles skip the upload.
+    """
+    if _OCL_OK and haystack.shape[0] * haystack.shape[1] >= OCL_MIN_HAYSTACK_PIXELS:
+        haystack = cv2.UMat(haystack)
+        needle = needle_umat if needle_umat is not None else cv2.UMat(needle)
+    result = cv2.matchTemplate(haystack, needle, method)
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    if method == cv2.TM_SQDIFF_NORMED:
+        return 1.0 - float(min_val), min_loc
+    return float(max_val), max_loc
+
+
+def _match_near(
+    haystack: Any,
+    needle: Any,
+    anchor: tuple[int, int],
+    method: int = MATCH_METHOD,
+) -> tuple[float, tuple[int, int]]:
+    """Match `needle` in a ``PYRAMID_REFINE_PADDING`` window around `anchor` (a top-left)."""
+    haystack_h, haystack_w = haystack.shape[:2]
+    needle_h, needle_w = needle.shape[:2]
+    anchor_x, anchor_y = anchor
+    left = max(anchor_x - PYRAMID_REFINE_PADDING, 0)
+    top = max(anchor_y - PYRAMID_REFINE_PADDING, 0)
+    right = min(anchor_x + needle_w + PYRAMID_REFINE_PADDING, haystack_w)
+    bottom = min(anchor_y + needle_h + PYRAMID_REFINE_PADDING, haystack_h)
+    left = min(left, right - needle_w)
+    top = min(top, bottom - needle_h)
+
+    confidence, (x, y) = _match_template(haystack[top:bottom, left:right], needle, method)
+    return confidence, (left + x, top + y)
+
+
+def _locate_needle(
+    haystack_gray: Any,
+    needle: _NeedleTemplate,
+    min_confidence: float,
+) -> tuple[float, tuple[int, int]]:
+    """Return (confidence, top_left) by searching the coarsest pyramid level and refining
+    the peak one level at a time down to full resolution.
+
+    A refined peak below `min_confidence` may just be a wrong coarse anchor, so the
+    answer then comes from a full-resolution search instead.
+    """
+    haystack_h, haystack_w = haystack_gray.shape[:2]
+    padding = PYRAMID_REFINE_PADDING << len(needle.levels)
+    no_slack = (
+        haystack_w - needle.width <= 2 * padding
+        and haystack_h - needle.height <= 2 * padding
+    )
+    too_small = haystack_h * haystack_w < PYRAMID_MIN_HAYSTACK_PIXELS
+    if not needle.levels or no_slack or too_small:
+        return _match_template(haystack_gray, needle.gray, needle_umat=needle.gray_umat)
+
+    haystack_levels = [haystack_gray]
+    for _ in needle.levels:
+        haystack_levels.append(cv2.pyrDown(haystack_levels[-1]))
+    confidence, (x, y) = _match_template(haystack_levels[-1], needle.coarse)
+
+    needle_levels = (needle.gray, *needle.levels)
+    for depth in range(len(needle.levels) - 1, -1, -1):
+        confidence, (x, y) = _match_near(
+            haystack_levels[depth], needle_levels[depth], (x * 2, y * 2)
+        )
+    if confidence < min_confidence:
+        return _match_template(haystack_gray, needle.gray, needle_umat=needle.gray_umat)
+    return confidence, (x, y)
+
+
+def _to_gray(image: Any) -> Any:
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def _build_match_result(
+    top_left: tuple[int, int],
+    needle_size: tuple[int, int],
+    confidence: float,
+) -> dict[str, float | int | str]:
+    needle_w, needle_h = needle_size
+    return {
+        "center_x": top_left[0] + needle_w // 2,
+        "center_y": top_left[1] + needle_h // 2,
+        "confidence": confidence,
+        "top_left_x": top_left[0],
+        "top_left_y": top_left[1],
+        "bottom_right_x": top_left[0] + needle_w,
+        "bottom_right_y": top_left[1] + needle_h,
+    }
+
+
+def _write_annotated_match(image: Any, match: dict[str, float | int | str], output_path: Path) -> None:
+    """Draw `match` onto `image` in place and write it to `output_path`."""
+    cv2.rectangle(
+        image,
+        (int(match["top_left_x"]), int(match["top_left_y"])),
+        (int(match["bottom_right_x"]), int(match["bottom_right_y"])),
+        (0, 0, 255),
+        2,
+    )
+    cv2.circle(image, (int(match["center_x"]), int(match["center_y"])), 6, (0, 255, 0), -1)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    cv2.imwrite(str(output_path), image)
+
+
+def preload_needles(needles: Iterable[str | Path]) -> list[Path]:
+    """Decode and cache `needles` ahead of the first search, returning the ones loaded.
+
+    Missing or unreadable files are skipped; searches report them when they are used.
+    """
+    loaded = []
+    for needle in needles:
+        path = _resolve_path(needle)
+        try:
+            _load_needle(path)
+        except FileNotFoundError:
+            LOGGER.debug("Skipping needle preload for %s", path)
+            continue
+        loaded.append(path)
+    return loaded
+
+
+def crop_center_array(image: Any, width: int, height: int) -> Any:
+    """Return a view of the centered `width` x `height` region of `image`."""
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be positive")
+
+    img_height, img_width = image.shape[:2]
+    crop_w = min(width, img_width)
+    crop_h = min(height, img_height)
+    left = max((img_width - crop_w) // 2, 0)
+    top = max((img_height - crop_h) // 2, 0)
+    return image[top : top + crop_h, left : left + crop_w]
+
+
 def crop_center_region(
     source: str | Path,
     width: int,
@@ -52,42 +274,94 @@ def crop_center_region(
     source_path = _resolve_path(source)
     destination_path = _resolve_path(destination or source_path.with_name(f"{source_path.stem}_center.png"))
 
-    image = _load_image(source_path)
-    img_height, img_width = image.shape[:2]
-
-    crop_w = min(width, img_width)
-    crop_h = min(height, img_height)
-    left = max((img_width - crop_w) // 2, 0)
-    top = max((img_height - crop_h) // 2, 0)
-    region = image[top : top + crop_h, left : left + crop_w]
+    region = crop_center_array(_load_image(source_path), width, height)
 
     destination_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(destination_path), region)
+    cv2.imwrite(str(destination_path), region, CROP_PNG_WRITE_PARAMS)
     return destination_path
 
 
+def _search_array(
+    needle: _NeedleTemplate,
+    haystack: Any,
+    output_path: str | Path | None,
+    match_threshold: float,
+) -> dict[str, float | int | str] | None:
+    start_time = time.perf_counter()
+    confidence, top_left = _locate_needle(_to_gray(haystack), needle, match_threshold)
+    if confidence < match_threshold:
+        LOGGER.info(
+            "Needle not found (score=%.3f, threshold=%.3f).",
+            confidence,
+            match_threshold,
+        )
+        return None
+
+    match = _build_match_result(top_left, (needle.width, needle.height), confidence)
+    if output_path is not None:
+        output_path = _resolve_path(output_path)
+        if haystack.ndim == 2:
+            annotated = cv2.cvtColor(haystack, cv2.COLOR_GRAY2BGR)
+        else:
+            annotated = haystack.copy()
+        _write_annotated_match(annotated, match, output_path)
+        match["output_path"] = str(output_path)
+
+    match["duration"] = time.perf_counter() - start_time
+    LOGGER.info(
+        "Needle center at (%d, %d) with confidence %.3f in %.3fs",
+        match["center_x"],
+        match["center_y"],
+        confidence,
+        match["duration"],
+    )
+    return match
+
+
+def find_image_array(
+    needle: Any,
+    haystack: Any,
+    output_path: str | Path | None = None,
+    match_threshold: float = 0.78,
+) -> dict[str, float | int | str] | None:
+    """Locate `needle` within `haystack` (BGR or grayscale arrays) via template matching.
+
+    The annotated haystack is only written when `output_path` is given.
+    """
+    return _search_array(_prepare_needle(_to_gray(needle)), haystack, output_path, match_threshold)
+
+
 def find_image(
     needle: str | Path = DEFAULT_NEEDLE_PATH,
-    haystack: str | Path = DEFAULT_HAYSTACK_PATH,
+    haystack: str | Path | np.ndarray = DEFAULT_HAYSTACK_PATH,
     output_path: str | Path = DEFAULT_OUTPUT_PATH,
     match_threshold: float = 0.78,
+    annotate: bool = True,
 ) -> dict[str, float | int | str] | None:
-    """Locate `needle` within `haystack` via template matching."""
+    """Locate `needle` within `haystack` via template matching.
+
+    `haystack` may be an already decoded BGR or grayscale array, in which case it is
+    searched in place. With `annotate=False` the marked copy of the haystack is not
+    produced and `output_path` is ignored.
+    """
     needle_path = _resolve_path(needle)
+    if isinstance(haystack, np.ndarray):
+        return _search_array(
+            _load_needle(needle_path),
+            haystack,
+            output_path if annotate else None,
+            match_threshold,
+        )
+
     haystack_path = _resolve_path(haystack)
     output_path = _resolve_path(output_path)
 
     start_time = time.perf_counter()
-    haystack_img = _load_image(haystack_path)
-    needle_img = _load_image(needle_path)
+    # Decode straight to one channel; the colour haystack is only needed for annotation.
+    haystack_gray = _load_image(haystack_path, cv2.IMREAD_GRAYSCALE)
+    needle = _load_needle(needle_path)
 
-    haystack_gray = cv2.cvtColor(haystack_img, cv2.COLOR_BGR2GRAY)
-    needle_gray = cv2.cvtColor(needle_img, cv2.COLOR_BGR2GRAY)
-
-    result = cv2.matchTemplate(haystack_gray, needle_gray, cv2.TM_CCOEFF_NORMED)
-    _, max_val, _, max_loc = cv2.minMaxLoc(result)
-
-    confidence = float(max_val)
+    confidence, top_left = _locate_needle(haystack_gray, needle, match_threshold)
     if confidence < match_threshold:
         LOGGER.info(
             "Needle not found (score=%.3f, threshold=%.3f).",
@@ -96,63 +370,57 @@ def find_image(
         )
         return None
 
-    needle_h, needle_w = needle_gray.shape[:2]
-    top_left = max_loc
-    bottom_right = (top_left[0] + needle_w, top_left[1] + needle_h)
-    center_x = top_left[0] + needle_w // 2
-    center_y = top_left[1] + needle_h // 2
-
-    annotated = haystack_img.copy()
-    cv2.rectangle(annotated, top_left, bottom_right, (0, 0, 255), 2)
-    cv2.circle(annotated, (center_x, center_y), 6, (0, 255, 0), -1)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(output_path), annotated)
+    match = _build_match_result(top_left, (needle.width, needle.height), confidence)
+    if annotate:
+        _write_annotated_match(_load_image(haystack_path), match, output_path)
+        match["output_path"] = str(output_path)
 
     duration = time.perf_counter() - start_time
     LOGGER.info(
         "Needle center at (%d, %d) with confidence %.3f in %.3fs -> %s",
-        center_x,
-        center_y,
+        match["center_x"],
+        match["center_y"],
         confidence,
         duration,
-        output_path,
+        match.get("output_path", "not annotated"),
     )
 
-    return {
-        "center_x": center_x,
-        "center_y": center_y,
-        "confidence": confidence,
-        "duration": duration,
-        "output_path": str(output_path),
-        "top_left_x": top_left[0],
-        "top_left_y": top_left[1],
-        "bottom_right_x": bottom_right[0],
-        "bottom_right_y": bottom_right[1],
-        "haystack_path": str(haystack_path),
-    }
+    match["duration"] = duration
+    match["haystack_path"] = str(haystack_path)
+    return match
 
 
 def find_image_in_center_region(
     needle: str | Path,
-    screenshot: str | Path,
+    screenshot: str | Path | np.ndarray,
     region_width: int,
     region_height: int,
     cropped_output: str | Path | None = None,
     marked_output: str | Path | None = None,
     match_threshold: float = 0.78,
+    annotate: bool = False,
 ) -> dict[str, float | int | str] | None:
-    """Crop the center region of `screenshot` and look for `needle` within it."""
-    cropped_path = crop_center_region(screenshot, region_width, region_height, cropped_output)
-    if marked_output is None:
-        cropped = Path(cropped_path)
-        marked_output = cropped.with_name(f"{cropped.stem}_marked{cropped.suffix}")
-    return find_image(
-        needle=needle,
-        haystack=cropped_path,
-        output_path=marked_output,
-        match_threshold=match_threshold,
-    )
+    """Crop the center region of `screenshot` and look for `needle` within it.
+
+    `screenshot` may be a path or an already captured BGR array. The crop is matched in
+    memory. `cropped_output` is written when provided; `marked_output` only when
+    `annotate` is also set.
+    """
+    marked_output = marked_output if annotate else None
+    if isinstance(screenshot, np.ndarray):
+        image = screenshot
+    else:
+        write_outputs = cropped_output is not None or marked_output is not None
+        flags = cv2.IMREAD_COLOR if write_outputs else cv2.IMREAD_GRAYSCALE
+        image = _load_image(_resolve_path(screenshot), flags)
+    region = crop_center_array(image, region_width, region_height)
+
+    if cropped_output is not None:
+        cropped_path = _resolve_path(cropped_output)
+        cropped_path.parent.mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(cropped_path), region, CROP_PNG_WRITE_PARAMS)
+
+    return _search_array(_load_needle(_resolve_path(needle)), region, marked_output, match_threshold)
 
 
 def annotate_search_area(
@@ -200,9 +468,12 @@ __all__ = [
     "DEFAULT_IMAGE_DIR",
     "DEFAULT_NEEDLE_PATH",
     "DEFAULT_OUTPUT_PATH",
+    "crop_center_array",
     "crop_center_region",
     "find_image",
+    "find_image_array",
     "find_image_in_center_region",
+    "preload_needles",
     "annotate_search_area",
 ]
 
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-import threading
+import logging
 import time
 from typing import Iterable
 
 import interception
 
-_init_lock = threading.Lock()
+LOGGER = logging.getLogger(__name__)
+
 _initialized = False
 
 
 def _ensure_ready() -> None:
+    """Capture interception devices if the import-time attempt did not succeed."""
     global _initialized
-    if _initialized:
-        return
-    with _init_lock:
-        if not _initialized:
-            interception.auto_capture_devices()
-            _initialized = True
+    if not _initialized:
+        interception.auto_capture_devices()
+        _initialized = True
+
+
+# Capture devices up front; every helper below still calls _ensure_ready (a single flag
+# test once captured) so a failure here is retried on first use.
+try:
+    _ensure_ready()
+except Exception:  # driver missing or no devices yet; retried lazily
+    LOGGER.debug("Deferred interception device capture.", exc_info=True)
 
 
 def press_key(key: str, repeat: int = 1, interval: float = 0.1) -> None:
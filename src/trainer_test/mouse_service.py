@@ -1,25 +1,35 @@
 from __future__ import annotations
 
-import random
-import threading
+import logging
 import time
 from typing import Iterable, Tuple
 
 import interception
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+# Delays shorter than this are spun out instead of slept; the Windows timer only wakes
+# sleepers every ~1-15 ms, which would stretch them several times over.
+BUSY_WAIT_THRESHOLD = 0.005
 
-_init_lock = threading.Lock()
 _initialized = False
 
 
 def _ensure_ready() -> None:
-    """Initialise interception once so subsequent calls are instant."""
+    """Capture interception devices if the import-time attempt did not succeed."""
     global _initialized
-    if _initialized:
-        return
-    with _init_lock:
-        if not _initialized:
-            interception.auto_capture_devices()
-            _initialized = True
+    if not _initialized:
+        interception.auto_capture_devices()
+        _initialized = True
+
+
+# Capture devices up front; every helper below still calls _ensure_ready (a single flag
+# test once captured) so a failure here is retried on first use.
+try:
+    _ensure_ready()
+except Exception:  # driver missing or no devices yet; retried lazily
+    LOGGER.debug("Deferred interception device capture.", exc_info=True)
 
 
 def move_to(x: int, y: int) -> None:
@@ -68,18 +78,28 @@ def position() -> Tuple[int, int]:
     return pos  # type: ignore[return-value]
 
 
+def _pause(delay: float) -> None:
+    """Wait ``delay`` seconds, busy-waiting (one core at 100%) below ``BUSY_WAIT_THRESHOLD``."""
+    if delay <= 0:
+        return
+    if delay >= BUSY_WAIT_THRESHOLD:
+        time.sleep(delay)
+        return
+    deadline = time.perf_counter() + delay
+    while time.perf_counter() < deadline:
+        pass
+
+
 def jitter(radius: int = 80, steps: int = 2, delay: float = 0.02) -> None:
     """Randomly move the mouse around its current position."""
     if radius <= 0 or steps <= 0:
         return
 
     current_x, current_y = position()
-    for _ in range(steps):
-        offset_x = random.randint(-radius, radius)
-        offset_y = random.randint(-radius, radius)
+    offsets = np.random.randint(-radius, radius + 1, size=(steps, 2), dtype=np.int32)
+    for offset_x, offset_y in offsets.tolist():
         move_to(current_x + offset_x, current_y + offset_y)
-        if delay > 0:
-            time.sleep(delay)
+        _pause(delay)
 
 
 __all__ = ["move_to", "move_by", "click", "right_click", "position", "jitter"]
@@ -1,86 +1,188 @@
 from __future__ import annotations
 
+import http.client
 import json
 import logging
+import mmap
+import os
+import threading
 import uuid
+from contextlib import nullcontext
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Any, BinaryIO, ContextManager
+from urllib.parse import urlsplit
+
+import cv2
 
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 10
 USER_AGENT = "trainer-test/1.0"
+ATTACHMENT_JPEG_QUALITY = 85
+
+_connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+_connection_lock = threading.Lock()
 
 
-def _send_request(request: Request, timeout: int) -> bool:
-    try:
-        with urlopen(request, timeout=timeout) as response:
-            status = getattr(response, "status", None)
-            if status is None or 200 <= status < 300:
-                return True
-            LOGGER.warning("Discord webhook responded with HTTP %s", status)
+def _get_connection(scheme: str, netloc: str, timeout: int) -> http.client.HTTPConnection:
+    """Return the kept-alive connection for ``netloc``, creating it on first use."""
+    key = (scheme, netloc)
+    connection = _connections.get(key)
+    if connection is None:
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        connection = connection_class(netloc, timeout=timeout)
+        _connections[key] = connection
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+    return connection
+
+
+def _post(
+    connection: http.client.HTTPConnection,
+    path: str,
+    body: Any,
+    headers: dict[str, str],
+) -> tuple[int, bytes, bool]:
+    connection.request("POST", path, body=body, headers=headers)
+    response = connection.getresponse()
+    # The body must be drained before the connection can carry another request.
+    return response.status, response.read(), response.will_close
+
+
+def _send_request(webhook_url: str, body: Any, headers: dict[str, str], timeout: int) -> bool:
+    """POST ``body`` over a persistent connection, reconnecting once if it went stale."""
+    parts = urlsplit(webhook_url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    with _connection_lock:
+        connection = _get_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            try:
+                status, response_body, will_close = _post(connection, path, body, headers)
+            except (http.client.BadStatusLine, ConnectionError):
+                # Discord drops idle keep-alive connections; retry once on a fresh socket.
+                connection.close()
+                status, response_body, will_close = _post(connection, path, body, headers)
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            LOGGER.exception("Unable to reach Discord webhook.")
             return False
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        LOGGER.error("Discord webhook failed with HTTP %s: %s", exc.code, body)
-    except URLError:
-        LOGGER.exception("Unable to reach Discord webhook.")
+        if will_close:
+            connection.close()
+
+    if 200 <= status < 300:
+        return True
+    if status >= 400:
+        LOGGER.error(
+            "Discord webhook failed with HTTP %s: %s",
+            status,
+            response_body.decode("utf-8", errors="ignore"),
+        )
+    else:
+        LOGGER.warning("Discord webhook responded with HTTP %s", status)
     return False
 
 
+def _multipart_envelope(payload_bytes: bytes, filename: str, boundary: str) -> tuple[bytes, bytes]:
+    """Return the multipart bytes that go before and after the attachment contents."""
+    boundary_bytes = boundary.encode("utf-8")
+    disposition = f'Content-Disposition: form-data; name="files[0]"; filename="{filename}"\r\n'
+
+    prefix = bytearray()
+    prefix.extend(b"--" + boundary_bytes + b"\r\n")
+    prefix.extend(b'Content-Disposition: form-data; name="payload_json"\r\n\r\n')
+    prefix.extend(payload_bytes + b"\r\n")
+    prefix.extend(b"--" + boundary_bytes + b"\r\n")
+    prefix.extend(disposition.encode("utf-8"))
+    prefix.extend(b"Content-Type: application/octet-stream\r\n\r\n")
+    suffix = b"\r\n--" + boundary_bytes + b"--\r\n"
+    return bytes(prefix), suffix
+
+
+def _map_file(handle: BinaryIO) -> ContextManager[Any]:
+    """Memory-map ``handle`` read-only; empty files, which mmap rejects, map to ``b""``."""
+    if os.fstat(handle.fileno()).st_size == 0:
+        return nullcontext(b"")
+    return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _compress_screenshot(file_path: Path) -> tuple[str, bytes] | None:
+    """Re-encode a PNG screenshot as JPEG, returning (filename, bytes) or None on failure."""
+    image = cv2.imread(str(file_path), cv2.IMREAD_COLOR)
+    if image is None:
+        LOGGER.warning("Unable to decode %s for compression; sending it unchanged.", file_path)
+        return None
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, ATTACHMENT_JPEG_QUALITY])
+    if not ok:
+        LOGGER.warning("JPEG encoding failed for %s; sending it unchanged.", file_path)
+        return None
+    return file_path.with_suffix(".jpg").name, encoded.tobytes()
+
+
+def _send_multipart(
+    webhook_url: str,
+    payload: dict[str, str],
+    headers: dict[str, str],
+    filename: str,
+    attachment: Any,
+    timeout: int,
+) -> bool:
+    boundary = uuid.uuid4().hex
+    prefix, suffix = _multipart_envelope(json.dumps(payload).encode("utf-8"), filename, boundary)
+    headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
+    # Iterable bodies are sent piece by piece; the length must be given explicitly.
+    headers["Content-Length"] = str(len(prefix) + len(attachment) + len(suffix))
+    return _send_request(webhook_url, [prefix, attachment, suffix], headers, timeout)
+
+
 def send_discord_notification(
     webhook_url: str,
     content: str,
     username: str | None = None,
     timeout: int = DEFAULT_TIMEOUT,
     file_path: str | Path | None = None,
+    compress: bool = True,
 ) -> bool:
-    """Send a Discord webhook message, optionally with an attached file."""
+    """Send a Discord webhook message, optionally with an attached file.
+
+    PNG attachments are re-encoded as JPEG before upload unless ``compress`` is False;
+    Discord recompresses them anyway. Other attachments are memory-mapped and streamed,
+    so the file is never read into Python memory as a whole.
+    """
     payload = {"content": content}
     if username:
         payload["username"] = username
 
     headers = {"User-Agent": USER_AGENT}
 
-    if file_path:
-        file_path = Path(file_path)
-        if not file_path.exists():
-            LOGGER.error("Attachment file not found: %s", file_path)
-            return False
-
-        boundary = uuid.uuid4().hex
-        boundary_bytes = boundary.encode("utf-8")
-        payload_bytes = json.dumps(payload).encode("utf-8")
-        file_bytes = file_path.read_bytes()
-
-        parts: list[bytes] = []
-        parts.append(b"--" + boundary_bytes + b"\r\n")
-        parts.append(b'Content-Disposition: form-data; name="payload_json"\r\n\r\n')
-        parts.append(payload_bytes + b"\r\n")
-        parts.append(b"--" + boundary_bytes + b"\r\n")
-        parts.append(
-            f'Content-Disposition: form-data; name="files[0]"; filename="{file_path.name}"\r\n'.encode(
-                "utf-8"
-            )
-        )
-        parts.append(b"Content-Type: application/octet-stream\r\n\r\n")
-        parts.append(file_bytes + b"\r\n")
-        parts.append(b"--" + boundary_bytes + b"--\r\n")
-
-        data = b"".join(parts)
-        headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
-    else:
-        data = json.dumps(payload).encode("utf-8")
+    if not file_path:
         headers["Content-Type"] = "application/json"
-
-    request = Request(
-        webhook_url,
-        data=data,
-        headers=headers,
-        method="POST",
-    )
-    return _send_request(request, timeout)
+        return _send_request(webhook_url, json.dumps(payload).encode("utf-8"), headers, timeout)
+
+    file_path = Path(file_path)
+    if not file_path.exists():
+        LOGGER.error("Attachment file not found: %s", file_path)
+        return False
+
+    if compress and file_path.suffix.lower() == ".png":
+        compressed = _compress_screenshot(file_path)
+        if compressed is not None:
+            filename, contents = compressed
+            return _send_multipart(webhook_url, payload, headers, filename, contents, timeout)
+
+    # A memoryview has no read() position, so http.client can send it again on the retry;
+    # the mmap object itself would be streamed from EOF the second time.
+    with (
+        file_path.open("rb") as handle,
+        _map_file(handle) as mapping,
+        memoryview(mapping) as attachment,
+    ):
+        return _send_multipart(webhook_url, payload, headers, file_path.name, attachment, timeout)
 
 
 __all__ = ["send_discord_notification"]
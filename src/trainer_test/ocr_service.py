@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any
+
+import numpy as np
+
+# The OCR regions are single short lines; OpenMP worker threads only add coordination
+# overhead there. Must be set before Tesseract loads (it is also inherited by the CLI).
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr  # type: ignore[import]
+except ImportError:  # optional; falls back to the pytesseract CLI wrapper
+    tesserocr = None
+
+try:
+    import pytesseract  # type: ignore[import]
+except ImportError:  # pragma: no cover - reported when OCR is first used
+    pytesseract = None
+
+LOGGER = logging.getLogger(__name__)
+
+SINGLE_LINE_PSM = 7
+SINGLE_WORD_PSM = 8
+DEFAULT_OEM = 3
+# Optional directory holding the smaller tessdata_fast eng.traineddata; Tesseract's own
+# default tessdata location is used when unset.
+TESSDATA_DIR = os.environ.get("TESSDATA_FAST_DIR") or None
+
+# One persistent engine per (psm, whitelist); None records that tesserocr failed to start.
+_apis: dict[tuple[int, str], tuple[Any, threading.Lock] | None] = {}
+_apis_lock = threading.Lock()
+
+
+def _get_api(psm: int, whitelist: str) -> tuple[Any, threading.Lock] | None:
+    key = (psm, whitelist)
+    with _apis_lock:
+        if key not in _apis:
+            try:
+                if TESSDATA_DIR:
+                    api = tesserocr.PyTessBaseAPI(path=TESSDATA_DIR, psm=psm, oem=DEFAULT_OEM)
+                else:
+                    api = tesserocr.PyTessBaseAPI(psm=psm, oem=DEFAULT_OEM)
+                api.SetVariable("tessedit_char_whitelist", whitelist)
+                _apis[key] = (api, threading.Lock())
+            except RuntimeError:
+                LOGGER.warning("tesserocr could not start; falling back to pytesseract.", exc_info=True)
+                _apis[key] = None
+        return _apis[key]
+
+
+def _read_with_tesserocr(image: np.ndarray, psm: int, whitelist: str) -> str | None:
+    entry = _get_api(psm, whitelist)
+    if entry is None:
+        return None
+    api, lock = entry
+    height, width = image.shape[:2]
+    with lock:
+        api.SetImageBytes(np.ascontiguousarray(image).tobytes(), width, height, 1, width)
+        return api.GetUTF8Text()
+
+
+def _read_with_pytesseract(image: np.ndarray, psm: int, whitelist: str) -> str | None:
+    if pytesseract is None:
+        LOGGER.error("pytesseract (and Pillow) are required for OCR; reinstall dependencies.")
+        return None
+    config = f"--psm {psm} --oem {DEFAULT_OEM} -c tessedit_char_whitelist={whitelist}"
+    if TESSDATA_DIR:
+        config = f'--tessdata-dir "{TESSDATA_DIR}" {config}'
+    try:
+        return pytesseract.image_to_string(image, config=config)
+    except pytesseract.TesseractNotFoundError:
+        LOGGER.error(
+            "Tesseract OCR engine is not installed or not on PATH; install it to continue."
+        )
+        return None
+
+
+def image_to_text(image: np.ndarray, whitelist: str, psm: int = SINGLE_LINE_PSM) -> str | None:
+    """OCR a single-channel uint8 `image`, restricted to the characters in `whitelist`.
+
+    Uses a kept-open tesserocr engine when that package is installed, otherwise spawns
+    Tesseract through pytesseract. Returns None when no engine is available.
+    """
+    if tesserocr is not None:
+        text = _read_with_tesserocr(image, psm, whitelist)
+        if text is not None:
+            return text
+    return _read_with_pytesseract(image, psm, whitelist)
+
+
+__all__ = ["SINGLE_LINE_PSM", "SINGLE_WORD_PSM", "image_to_text"]
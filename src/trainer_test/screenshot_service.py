@@ -1,54 +1,90 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Literal, Tuple
 
+import cv2
 import mss
-import mss.tools
+import numpy as np
+from mss.base import MSSBase
 
 LOGGER = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "screenshots"
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+JPEG_WRITE_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 90]
+
+_session = threading.local()
 
 
 def _ensure_output_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _get_sct() -> MSSBase:
+    """Return this thread's mss session, opening it on first use and keeping it open."""
+    sct = getattr(_session, "sct", None)
+    if sct is None:
+        sct = mss.mss()
+        _session.sct = sct
+    return sct
+
+
+def _grab_bgra(region: Tuple[int, int, int, int] | None) -> np.ndarray:
+    """Grab the screen (or region) as a BGRA array viewing mss's buffer without copying."""
+    sct = _get_sct()
+    if region:
+        left, top, right, bottom = region
+        monitor = {
+            "left": left,
+            "top": top,
+            "width": right - left,
+            "height": bottom - top,
+        }
+    else:
+        monitor = sct.monitors[0]
+    return np.asarray(sct.grab(monitor))
+
+
+def capture_screenshot_array(region: Tuple[int, int, int, int] | None = None) -> np.ndarray:
+    """Capture a screenshot (full screen or region) and return it as a BGR array."""
+    return cv2.cvtColor(_grab_bgra(region), cv2.COLOR_BGRA2BGR)
+
+
 def capture_screenshot(
     output_path: str | Path | None = None,
     region: Tuple[int, int, int, int] | None = None,
+    fmt: Literal["png", "jpg"] = "png",
 ) -> Path:
-    """Capture a screenshot (full screen or region) and return the saved path."""
+    """Capture a screenshot (full screen or region) and return the saved path.
+
+    Use ``fmt="jpg"`` when the file is only an intermediate for template matching;
+    JPEG encodes much faster than PNG. ``fmt`` picks the encoder; ``output_path`` is used
+    exactly as given.
+    """
     if output_path is None:
         _ensure_output_dir(DEFAULT_OUTPUT_DIR)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = DEFAULT_OUTPUT_DIR / f"screenshot_{timestamp}.png"
+        output_path = DEFAULT_OUTPUT_DIR / f"screenshot_{timestamp}.{fmt}"
 
     output_path = Path(output_path)
     _ensure_output_dir(output_path.parent)
 
-    with mss.mss() as sct:
-        if region:
-            left, top, right, bottom = region
-            monitor = {
-                "left": left,
-                "top": top,
-                "width": right - left,
-                "height": bottom - top,
-            }
-        else:
-            monitor = sct.monitors[0]
-
-        image = sct.grab(monitor)
-        mss.tools.to_png(image.rgb, image.size, output=str(output_path))
-        LOGGER.debug("Captured screenshot to %s", output_path)
+    # mss hands back BGRA; drop the alpha channel on encode instead of converting first.
+    frame = _grab_bgra(region)
+    params = JPEG_WRITE_PARAMS if fmt == "jpg" else PNG_WRITE_PARAMS
+    ok, encoded = cv2.imencode(f".{fmt}", frame[:, :, :3], params)
+    if not ok:
+        raise RuntimeError(f"Unable to encode screenshot as {fmt}")
+    output_path.write_bytes(encoded.tobytes())
+    LOGGER.debug("Captured screenshot to %s", output_path)
 
     return output_path
 
 
-__all__ = ["capture_screenshot", "DEFAULT_OUTPUT_DIR"]
+__all__ = ["capture_screenshot", "capture_screenshot_array", "DEFAULT_OUTPUT_DIR"]
 
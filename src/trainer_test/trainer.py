@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import random
 from dataclasses import dataclass
@@ -9,17 +10,31 @@ import signal
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 import cv2
+import numpy as np
 
 from .audio_service import play_audio
-from .image_service import annotate_search_area, find_image, find_image_in_center_region
+from .image_service import (
+    annotate_search_area,
+    find_image,
+    find_image_in_center_region,
+    preload_needles,
+)
 from .keyboard_service import press_key, tap
 from .mouse_service import jitter, right_click
-from .screenshot_service import capture_screenshot
+from .screenshot_service import capture_screenshot_array
 from .notificator_service import send_discord_notification
-from .window_service import WindowInfo, find_window_info, focus_window, get_primary_screen_size
+from .ocr_service import SINGLE_WORD_PSM, image_to_text
+from .window_service import (
+    WindowInfo,
+    find_window_info,
+    get_primary_screen_size,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -67,12 +82,11 @@ LEVEL_BOX_HEIGHT = 45
 LEVEL_OFFSET_X = 555
 LEVEL_OFFSET_Y = -370
 LEVEL_MAX_VALUE = 400
-LEVEL_UPSCALE_FACTOR = 3
+LEVEL_UPSCALE_FACTOR = 2
 LEVEL_CLAHE_CLIP_LIMIT = 2.0
 LEVEL_CLAHE_TILE = (8, 8)
-LEVEL_TESSERACT_CONFIG = (
-    "--psm 7 --oem 3 -c tessedit_char_whitelist=Level:/0123456789"
-)
+LEVEL_OCR_WHITELIST = "Level:/0123456789"
+_LEVEL_MAX_DIGITS = len(str(LEVEL_MAX_VALUE))
 LEVEL_TEXT_PATTERN = re.compile(r"Level:\s*(\d+)\s*/\s*400", re.IGNORECASE)
 
 ZEN_REGION_WIDTH = 120
@@ -82,8 +96,10 @@ ZEN_OFFSET_Y = 309
 ZEN_DEBUG_PATH = VISION_DIR / "screenshot_zen_debug.png"
 VISION_ZEN_REGION = VISION_DIR / "zen_region.png"
 ZEN_TEXT_PATTERN = re.compile(r"^\s*([0-9][0-9,]*)\s*$")
-ZEN_TESSERACT_CONFIG = "--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789,"
+_ZEN_SEPARATORS = str.maketrans("", "", ",")
+ZEN_OCR_WHITELIST = "0123456789,"
 ZEN_MAX_VALUE = 2_000_000_000
+_ZEN_MAX_DIGITS = len(str(ZEN_MAX_VALUE))
 
 VISION_DIALOG_SCREENSHOT = VISION_DIR / "screenshot_dialog.png"
 VISION_DIALOG_NEEDLE = VISION_DIR / "dialog_needle.png"
@@ -135,6 +151,11 @@ RUN_ZEN_REGION = VISION_RUN_DIR / "zen_region.png"
 RUN_ZEN_DEBUG = VISION_RUN_DIR / "zen_debug.png"
 RUN_ERROR_ATTACHMENT = VISION_RUN_DIR / "error_attachment.png"
 
+# When False the run loop keeps screenshots and crops in memory and only writes the
+# error attachment; set True to also save every capture, region and debug overlay.
+DEBUG_ARTIFACTS = False
+FAST_PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 NOTIFICATION_IMAGE_OUTPUT = VISION_DIR / "notification_issue.png"
 NOTIFICATION_IMAGE_WIDTH = 1920
 NOTIFICATION_IMAGE_HEIGHT = 1080
@@ -151,18 +172,26 @@ STAR_EMOJI = "⭐"
 WARNING_ICON = "⚠️"
 COIN_EMOJI = "🪙"
 ROCKET_EMOJI = "🚀"
+# Crossing any of these levels sends a milestone message.
+LEVEL_MILESTONES = (380, 280, 150)
+
+_MENTION = f"<@{DISCORD_UID}>"
+_LEVEL_MILESTONE_MESSAGE = "Character reached level {}".format
 
 STARTING_MAX_ATTEMPTS = 5
 STARTING_RETRY_DELAY_SECONDS = 5
 HEALTHCHECK_INTERVAL_SECONDS = 180
 MENU_MAX_RETRIES = 10
 MENU_CLOSE_MAX_RETRIES = 10
+# After each menu key press the screen is polled this long before the key is pressed again.
+MENU_TAP_DELAY_SECONDS = 0.5
+MENU_POLL_INTERVAL_SECONDS = 0.25
+MENU_POLL_TIMEOUT_SECONDS = 2.0
 LEVEL_MAX_ATTEMPTS = 3
 ZEN_MAX_ATTEMPTS = 3
 ZEN_THRESHOLD_INFO = 1_900_000_000
 
 LOG_LEVEL = "INFO"
-FOCUS_WINDOW_SUBSTRING = "PREFIX1"
 FOCUS_EACH_CYCLE = True
 START_DELAY_SECONDS = 3.0
 RIGHT_CLICK_COUNT = 24
@@ -182,6 +211,13 @@ SCALE_OFFSETS = True
 
 WINDOW_TITLE_PREFIXES = ("PREFIX1", "PREFIX2")
 
+# CLAHE objects keep internal buffers between apply() calls, so share them under a lock.
+_LEVEL_CLAHE = cv2.createCLAHE(clipLimit=LEVEL_CLAHE_CLIP_LIMIT, tileGridSize=LEVEL_CLAHE_TILE)
+_ZEN_CLAHE = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8, 8))
+_CLAHE_LOCK = threading.Lock()
+
+_debug_buffer: np.ndarray | None = None
+_debug_buffer_lock = threading.Lock()
 _offset_scale_x = 1.0
 _offset_scale_y = 1.0
 
@@ -200,8 +236,8 @@ class VisionSearchConfig:
 class OcrResult:
     text: str
     value: int | None
-    region_path: Path
-    debug_path: Path
+    region_path: Path | None
+    debug_path: Path | None
 
 
 INGAME_SEARCH_CONFIG = VisionSearchConfig(
@@ -240,6 +276,19 @@ CHARACTER_SEARCH_CONFIG = VisionSearchConfig(
     offset_y=CHARACTER_OFFSET_Y,
 )
 
+ALL_SEARCH_CONFIGS = (
+    INGAME_SEARCH_CONFIG,
+    DIALOG_SEARCH_CONFIG,
+    INVENTORY_SEARCH_CONFIG,
+    CHARACTER_SEARCH_CONFIG,
+)
+
+RUNTIME_NEEDLES = (
+    NEEDLE_PRIMARY,
+    NEEDLE_FALLBACK,
+    *(config.needle for config in ALL_SEARCH_CONFIGS),
+)
+
 
 def _parse_args(argv: list[str] | None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Trainer orchestrator.")
@@ -303,22 +352,6 @@ def _setup_logging() -> None:
     )
 
 
-def _focus_target(log_missing: bool = True) -> None:
-    if not FOCUS_WINDOW_SUBSTRING:
-        return
-
-    info = find_window_info(FOCUS_WINDOW_SUBSTRING)
-    if not info:
-        if log_missing:
-            LOGGER.warning("Window containing '%s' not found.", FOCUS_WINDOW_SUBSTRING)
-        return
-
-    if focus_window(info.handle):
-        LOGGER.debug("Focused window '%s' (%s)", info.title, hex(info.handle))
-    else:
-        LOGGER.warning("Failed to focus window '%s' (%s)", info.title, hex(info.handle))
-
-
 def _find_mu_window_info() -> WindowInfo | None:
     for prefix in WINDOW_TITLE_PREFIXES:
         info = find_window_info(prefix, log_missing=False, match_mode="prefix")
@@ -447,7 +480,7 @@ def _handle_reward_sequence(stop_event: threading.Event) -> bool:
         return False
 
     try:
-        screenshot_path = capture_screenshot(SCREENSHOT_PATH)
+        screenshot = _capture_frame(SCREENSHOT_PATH)
     except Exception:
         LOGGER.exception("Failed to capture screenshot for reward check.")
         return False
@@ -460,11 +493,12 @@ def _handle_reward_sequence(stop_event: threading.Event) -> bool:
     try:
         result = find_image_in_center_region(
             needle=needle_path,
-            screenshot=screenshot_path,
+            screenshot=screenshot,
             region_width=REGION_WIDTH,
             region_height=REGION_HEIGHT,
-            cropped_output=SCREENSHOT_REGION_PATH,
+            cropped_output=SCREENSHOT_REGION_PATH if DEBUG_ARTIFACTS else None,
             marked_output=SCREENSHOT_REGION_MARKED_PATH,
+            annotate=DEBUG_ARTIFACTS,
         )
     except Exception:
         LOGGER.exception("Image search failed.")
@@ -505,6 +539,7 @@ def _run_image_find_test() -> int:
         region_height=TEST_REGION_HEIGHT,
         cropped_output=TEST_REGION_OUTPUT,
         marked_output=TEST_REGION_MARKED,
+        annotate=True,
     )
 
     annotate_search_area(
@@ -531,6 +566,63 @@ def _run_image_find_test() -> int:
     return 2
 
 
+@functools.lru_cache(maxsize=4)
+def _imread_cached(path_str: str, mtime_ns: int) -> np.ndarray:
+    """Decode a screenshot once per file version; `mtime_ns` only takes part in the cache key."""
+    image = cv2.imread(path_str)
+    if image is None:
+        raise FileNotFoundError(path_str)
+    # Shared between detectors, so guard against accidental in-place drawing.
+    image.flags.writeable = False
+    return image
+
+
+def _read_screenshot(screenshot_path: Path) -> np.ndarray | None:
+    """Return the decoded screenshot, reusing the previous decode if the file is unchanged."""
+    try:
+        return _imread_cached(str(screenshot_path), screenshot_path.stat().st_mtime_ns)
+    except OSError:  # missing file, or cv2 could not decode it
+        return None
+
+
+def _load_screenshot(screenshot: Path | np.ndarray, label: str) -> np.ndarray | None:
+    """Return `screenshot` as an image, decoding it first when given a path."""
+    if isinstance(screenshot, np.ndarray):
+        return screenshot
+    if not screenshot.exists():
+        LOGGER.error("%s screenshot not found: %s", label, screenshot)
+        return None
+    image = _read_screenshot(screenshot)
+    if image is None:
+        LOGGER.error("Failed to read %s screenshot: %s", label, screenshot)
+    return image
+
+
+@contextmanager
+def _debug_canvas(image: np.ndarray) -> Iterator[np.ndarray]:
+    """Yield a copy of `image` in a shared buffer for drawing a debug overlay.
+
+    The buffer is reused across calls and held under a lock, so draw and write inside the block.
+    """
+    global _debug_buffer
+    with _debug_buffer_lock:
+        if _debug_buffer is None or _debug_buffer.shape != image.shape:
+            _debug_buffer = np.empty_like(image)
+        np.copyto(_debug_buffer, image)
+        yield _debug_buffer
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(directory: Path) -> None:
+    """Create `directory` on first use; later calls for the same directory are free."""
+    directory.mkdir(parents=True, exist_ok=True)
+
+
+def _write_image(path: Path, image: np.ndarray) -> None:
+    _ensure_dir(path.parent)
+    cv2.imwrite(str(path), image, FAST_PNG_WRITE_PARAMS)
+
+
 def _compute_region_bounds(total_size: int, region_size: int, desired_center: int) -> tuple[int, int]:
     """Return (start, end) bounds clamped to the image size."""
     if total_size <= 0:
@@ -543,6 +635,7 @@ def _compute_region_bounds(total_size: int, region_size: int, desired_center: in
     return start, end
 
 
+@functools.lru_cache(maxsize=64)
 def _calculate_centered_region(
     image_width: int,
     image_height: int,
@@ -558,25 +651,25 @@ def _calculate_centered_region(
     return left, top, right, bottom
 
 
-def _capture_screenshot_to(target_path: Path) -> Path:
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    return capture_screenshot(target_path)
+def _capture_frame(debug_path: Path) -> np.ndarray:
+    """Capture the screen in memory, saving it to `debug_path` only with ``DEBUG_ARTIFACTS``."""
+    frame = capture_screenshot_array()
+    if DEBUG_ARTIFACTS:
+        _write_image(debug_path, frame)
+    return frame
 
 
 def _run_centered_search_runtime(
-    screenshot_path: Path,
+    screenshot: Path | np.ndarray,
     config: VisionSearchConfig,
 ) -> tuple[bool, Path | None, Path | None]:
-    if not screenshot_path.exists():
-        LOGGER.error("Screenshot not found for %s search: %s", config.label, screenshot_path)
-        return False, None, None
+    """Search the configured region; region and debug paths are None unless ``DEBUG_ARTIFACTS``."""
     if not config.needle.exists():
         LOGGER.error("Needle not found for %s search: %s", config.label, config.needle)
         return False, None, None
 
-    image = cv2.imread(str(screenshot_path))
+    image = _load_screenshot(screenshot, config.label)
     if image is None:
-        LOGGER.error("Failed to read screenshot for %s search: %s", config.label, screenshot_path)
         return False, None, None
 
     height, width = image.shape[:2]
@@ -607,78 +700,130 @@ def _run_centered_search_runtime(
         LOGGER.error("%s search region contains no pixels.", config.label)
         return False, None, None
 
-    VISION_RUN_DIR.mkdir(parents=True, exist_ok=True)
-    region_path = VISION_RUN_DIR / f"{config.label}_region.png"
-    region_marked_path = VISION_RUN_DIR / f"{config.label}_region_marked.png"
-    debug_path = VISION_RUN_DIR / f"{config.label}_debug.png"
-
-    cv2.imwrite(str(region_path), region)
     result = find_image(
         needle=config.needle,
-        haystack=region_path,
-        output_path=region_marked_path,
-    )
-
-    debug_image = image.copy()
-    cv2.rectangle(
-        debug_image,
-        (left, top),
-        (max(right - 1, left), max(bottom - 1, top)),
-        (255, 255, 0),
-        2,
+        haystack=region,
+        annotate=False,
     )
+    if not DEBUG_ARTIFACTS:
+        return result is not None, None, None
 
-    if result:
-        top_left_x = left + int(result.get("top_left_x", 0))
-        top_left_y = top + int(result.get("top_left_y", 0))
-        bottom_right_x = left + int(result.get("bottom_right_x", 0))
-        bottom_right_y = top + int(result.get("bottom_right_y", 0))
-        center_x = left + int(result.get("center_x", 0))
-        center_y = top + int(result.get("center_y", 0))
+    region_path = VISION_RUN_DIR / f"{config.label}_region.png"
+    debug_path = VISION_RUN_DIR / f"{config.label}_debug.png"
+    _write_image(region_path, region)
 
+    with _debug_canvas(image) as debug_image:
         cv2.rectangle(
             debug_image,
-            (top_left_x, top_left_y),
-            (bottom_right_x, bottom_right_y),
-            (0, 0, 255),
+            (left, top),
+            (max(right - 1, left), max(bottom - 1, top)),
+            (255, 255, 0),
             2,
         )
-        cv2.circle(debug_image, (center_x, center_y), 5, (0, 255, 0), -1)
 
-    cv2.imwrite(str(debug_path), debug_image)
+        if result:
+            top_left_x = left + int(result.get("top_left_x", 0))
+            top_left_y = top + int(result.get("top_left_y", 0))
+            bottom_right_x = left + int(result.get("bottom_right_x", 0))
+            bottom_right_y = top + int(result.get("bottom_right_y", 0))
+            center_x = left + int(result.get("center_x", 0))
+            center_y = top + int(result.get("center_y", 0))
+
+            cv2.rectangle(
+                debug_image,
+                (top_left_x, top_left_y),
+                (bottom_right_x, bottom_right_y),
+                (0, 0, 255),
+                2,
+            )
+            cv2.circle(debug_image, (center_x, center_y), 5, (0, 255, 0), -1)
+
+        _write_image(debug_path, debug_image)
     return result is not None, region_path, debug_path
 
 
-def _detect_with_config(screenshot_path: Path, config: VisionSearchConfig) -> tuple[bool, Path | None, Path | None]:
-    return _run_centered_search_runtime(screenshot_path, config)
+def _detect_with_config(
+    screenshot: Path | np.ndarray,
+    config: VisionSearchConfig,
+) -> tuple[bool, Path | None, Path | None]:
+    return _run_centered_search_runtime(screenshot, config)
+
+
+def _detect_all(
+    screenshot: Path | np.ndarray,
+    configs: tuple[VisionSearchConfig, ...] = ALL_SEARCH_CONFIGS,
+) -> dict[str, tuple[bool, Path | None, Path | None]]:
+    """Run several detectors on one decoded frame in parallel, keyed by config label.
+
+    OpenCV releases the GIL inside matchTemplate, so the searches overlap on separate cores.
+    """
+    image = _load_screenshot(screenshot, "detector")
+    if image is None:
+        return {config.label: (False, None, None) for config in configs}
 
+    with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+        futures = {
+            config.label: executor.submit(_run_centered_search_runtime, image, config)
+            for config in configs
+        }
+    return {label: future.result() for label, future in futures.items()}
 
-def _detect_ingame(screenshot_path: Path) -> tuple[bool, Path | None, Path | None]:
-    return _detect_with_config(screenshot_path, INGAME_SEARCH_CONFIG)
 
+def _detect_ingame(screenshot: Path | np.ndarray) -> tuple[bool, Path | None, Path | None]:
+    return _detect_with_config(screenshot, INGAME_SEARCH_CONFIG)
 
-def _detect_dialog(screenshot_path: Path) -> tuple[bool, Path | None, Path | None]:
-    return _detect_with_config(screenshot_path, DIALOG_SEARCH_CONFIG)
 
+def _detect_dialog(screenshot: Path | np.ndarray) -> tuple[bool, Path | None, Path | None]:
+    return _detect_with_config(screenshot, DIALOG_SEARCH_CONFIG)
 
-def _detect_inventory(screenshot_path: Path) -> tuple[bool, Path | None, Path | None]:
-    return _detect_with_config(screenshot_path, INVENTORY_SEARCH_CONFIG)
 
+def _detect_inventory(screenshot: Path | np.ndarray) -> tuple[bool, Path | None, Path | None]:
+    return _detect_with_config(screenshot, INVENTORY_SEARCH_CONFIG)
 
-def _detect_character_menu(screenshot_path: Path) -> tuple[bool, Path | None, Path | None]:
-    return _detect_with_config(screenshot_path, CHARACTER_SEARCH_CONFIG)
+
+def _detect_character_menu(screenshot: Path | np.ndarray) -> tuple[bool, Path | None, Path | None]:
+    return _detect_with_config(screenshot, CHARACTER_SEARCH_CONFIG)
 
 
 def _tap_with_delay(key: str, delay: float = 2) -> None:
-    actual_delay = max(0.0, delay + random.uniform(-0.5, 0.5))
+    # Proportional jitter: +/-0.5s around the default 2s, and never collapsing a short delay to 0.
+    actual_delay = delay * random.uniform(0.75, 1.25)
     LOGGER.info("Sending key '%s' with %.3fs post-delay.", key, actual_delay)
     tap(key)
     time.sleep(actual_delay)
 
 
+def _tap_until(
+    key: str,
+    detector: Callable[[np.ndarray], tuple[bool, Path | None, Path | None]],
+    want_visible: bool,
+    attempts: int,
+    debug_path: Path,
+) -> tuple[bool, np.ndarray | None]:
+    """Press `key` and poll `detector` until it reports `want_visible`.
+
+    The key is only pressed again once a poll times out, so a slow menu is not toggled
+    back. Returns whether the state was reached and the last captured frame.
+    """
+    frame: np.ndarray | None = None
+    for attempt in range(attempts):
+        _tap_with_delay(key, MENU_TAP_DELAY_SECONDS)
+        deadline = time.monotonic() + MENU_POLL_TIMEOUT_SECONDS
+        while True:
+            frame = _capture_frame(debug_path)
+            visible, _, _ = detector(frame)
+            if visible == want_visible:
+                return True, frame
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(MENU_POLL_INTERVAL_SECONDS)
+        LOGGER.info("Key '%s' had no effect yet (attempt %d/%d).", key, attempt + 1, attempts)
+    return False, frame
+
+
 def _send_info_notification(message: str, emoji: str | None = None) -> bool:
     suffix = emoji or STAR_EMOJI
-    content = f"<@{DISCORD_UID}> {CHARACTER_NAME}. {message} {suffix}"
+    content = f"{_MENTION} {CHARACTER_NAME}. {message} {suffix}"
     success = send_discord_notification(DISCORD_WEBHOOK_URL, content)
     if success:
         LOGGER.info("Discord info message sent: %s", message)
@@ -687,9 +832,9 @@ def _send_info_notification(message: str, emoji: str | None = None) -> bool:
     return success
 
 
-def _send_error_notification(message: str, screenshot_path: Path | None = None) -> bool:
-    attachment = _prepare_error_attachment(screenshot_path)
-    content = f"<@{DISCORD_UID}> Error for {CHARACTER_NAME}. {message} {WARNING_ICON}"
+def _send_error_notification(message: str, screenshot: Path | np.ndarray | None = None) -> bool:
+    attachment = _prepare_error_attachment(screenshot)
+    content = f"{_MENTION} Error for {CHARACTER_NAME}. {message} {WARNING_ICON}"
     success = send_discord_notification(
         DISCORD_WEBHOOK_URL,
         content,
@@ -703,20 +848,15 @@ def _send_error_notification(message: str, screenshot_path: Path | None = None)
 
 
 def _prepare_center_crop(
-    screenshot_path: Path,
+    screenshot: Path | np.ndarray,
     width: int,
     height: int,
     output_path: Path,
     offset_x: int = 0,
     offset_y: int = 0,
 ) -> Path | None:
-    if not screenshot_path.exists():
-        LOGGER.error("Screenshot not found for cropping: %s", screenshot_path)
-        return None
-
-    image = cv2.imread(str(screenshot_path))
+    image = _load_screenshot(screenshot, "Crop")
     if image is None:
-        LOGGER.error("Failed to read screenshot for cropping: %s", screenshot_path)
         return None
 
     img_height, img_width = image.shape[:2]
@@ -731,19 +871,18 @@ def _prepare_center_crop(
 
     region = image[top:bottom, left:right]
     if region.size == 0:
-        LOGGER.error("Center crop produced an empty region for %s", screenshot_path)
+        LOGGER.error("Center crop produced an empty region.")
         return None
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(output_path), region)
+    _write_image(output_path, region)
     return output_path
 
 
-def _prepare_error_attachment(screenshot_path: Path | None) -> Path | None:
-    if not screenshot_path:
+def _prepare_error_attachment(screenshot: Path | np.ndarray | None) -> Path | None:
+    if screenshot is None:
         return None
     return _prepare_center_crop(
-        screenshot_path,
+        screenshot,
         NOTIFICATION_IMAGE_WIDTH,
         NOTIFICATION_IMAGE_HEIGHT,
         RUN_ERROR_ATTACHMENT,
@@ -803,17 +942,18 @@ def _run_centered_image_search(
         LOGGER.error("%s search region contains no pixels.", search_label.title())
         return 1
 
-    region_output.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(region_output.parent)
     cv2.imwrite(str(region_output), region)
 
-    region_marked_output.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(region_marked_output.parent)
     result = find_image(
         needle=needle_path,
         haystack=region_output,
         output_path=region_marked_output,
     )
 
-    debug = screenshot.copy()
+    # The search above is finished with `screenshot`, so the overlay is drawn on it directly.
+    debug = screenshot
     cv2.rectangle(
         debug,
         (left, top),
@@ -857,29 +997,32 @@ def _run_centered_image_search(
         LOGGER.info(not_found_message)
         exit_code = 2
 
-    debug_output.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(debug_output.parent)
     cv2.imwrite(str(debug_output), debug)
     LOGGER.info("%s search debug screenshot saved to %s", search_label.title(), debug_output)
 
     return exit_code
 
 
-def _preprocess_level_region(region):
-    """Apply grayscale, contrast enhancement, scaling, and thresholding."""
+def _preprocess_level_region(region, invert: bool = False):
+    """Apply grayscale, contrast enhancement and thresholding, then scale up for Tesseract.
+
+    `invert` produces dark text on a light background instead.
+    """
     gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
-    upscaled = cv2.resize(
-        gray,
+    # Enhance and threshold at native size; only the final binary image is upscaled.
+    with _CLAHE_LOCK:
+        enhanced = _LEVEL_CLAHE.apply(gray)
+    threshold_type = cv2.THRESH_BINARY_INV if invert else cv2.THRESH_BINARY
+    _, thresh = cv2.threshold(enhanced, 0, 255, threshold_type + cv2.THRESH_OTSU)
+    return cv2.resize(
+        thresh,
         None,
         fx=LEVEL_UPSCALE_FACTOR,
         fy=LEVEL_UPSCALE_FACTOR,
-        interpolation=cv2.INTER_CUBIC,
-    )
-    clahe = cv2.createCLAHE(
-        clipLimit=LEVEL_CLAHE_CLIP_LIMIT, tileGridSize=LEVEL_CLAHE_TILE
+        # Nearest keeps the image strictly 0/255; linear would reintroduce grey edges.
+        interpolation=cv2.INTER_NEAREST,
     )
-    enhanced = clahe.apply(upscaled)
-    _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    return thresh
 
 
 def _preprocess_currency_region(region):
@@ -889,26 +1032,22 @@ def _preprocess_currency_region(region):
         None,
         fx=2.0,
         fy=2.0,
-        interpolation=cv2.INTER_CUBIC,
+        interpolation=cv2.INTER_LINEAR,
     )
-    clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8, 8))
-    enhanced = clahe.apply(upscaled)
+    with _CLAHE_LOCK:
+        enhanced = _ZEN_CLAHE.apply(upscaled)
     _, thresh = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     return thresh
 
 
 def _perform_level_ocr_from_screenshot(
-    screenshot_path: Path,
-    debug_path: Path,
-    region_output: Path,
+    screenshot: Path | np.ndarray,
+    debug_path: Path | None,
+    region_output: Path | None,
 ) -> OcrResult | None:
-    if not screenshot_path.exists():
-        LOGGER.error("Level screenshot not found: %s", screenshot_path)
-        return None
-
-    image = cv2.imread(str(screenshot_path))
+    """Run level OCR; the debug overlay and region crop are only saved when paths are given."""
+    image = _load_screenshot(screenshot, "Level")
     if image is None:
-        LOGGER.error("Failed to read level screenshot: %s", screenshot_path)
         return None
 
     height, width = image.shape[:2]
@@ -933,51 +1072,43 @@ def _perform_level_ocr_from_screenshot(
         )
         return None
 
-    debug_image = image.copy()
-    cv2.rectangle(
-        debug_image,
-        (left, top),
-        (max(right - 1, left), max(bottom - 1, top)),
-        (0, 0, 255),
-        2,
-    )
-    debug_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(debug_path), debug_image)
-    LOGGER.info("Level debug screenshot saved to %s", debug_path)
+    if debug_path is not None:
+        with _debug_canvas(image) as debug_image:
+            cv2.rectangle(
+                debug_image,
+                (left, top),
+                (max(right - 1, left), max(bottom - 1, top)),
+                (0, 0, 255),
+                2,
+            )
+            _write_image(debug_path, debug_image)
+        LOGGER.info("Level debug screenshot saved to %s", debug_path)
 
     region = image[top:bottom, left:right]
     if region.size == 0:
         LOGGER.error("Level OCR region contains no pixels.")
         return None
 
-    region_output.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(region_output), region)
-
-    preprocessed = _preprocess_level_region(region)
+    if region_output is not None:
+        _write_image(region_output, region)
 
-    try:
-        import pytesseract  # type: ignore[import]
-        from PIL import Image  # type: ignore[import]
-    except ImportError:
-        LOGGER.error("pytesseract (and Pillow) are required for OCR; reinstall dependencies.")
-        return None
+    # Retry the same crop with inverted binarization before the caller recaptures the screen.
+    for invert in (False, True):
+        preprocessed = _preprocess_level_region(region, invert=invert)
 
-    pil_image = Image.fromarray(preprocessed)
-    try:
-        text = pytesseract.image_to_string(pil_image, config=LEVEL_TESSERACT_CONFIG)
-    except pytesseract.TesseractNotFoundError:
-        LOGGER.error(
-            "Tesseract OCR engine is not installed or not on PATH; install it to continue."
-        )
-        return None
+        text = image_to_text(preprocessed, LEVEL_OCR_WHITELIST)
+        if text is None:
+            return None
 
-    cleaned_text = text.strip()
-    if cleaned_text:
-        LOGGER.info("Level OCR detected text: %s", cleaned_text)
-    else:
-        LOGGER.info("Level OCR detected no text.")
+        cleaned_text = text.strip()
+        if cleaned_text:
+            LOGGER.info("Level OCR detected text: %s", cleaned_text)
+        else:
+            LOGGER.info("Level OCR detected no text.")
 
-    level_value = _extract_level_value(cleaned_text)
+        level_value = _extract_level_value(cleaned_text)
+        if level_value is not None:
+            break
     return OcrResult(
         text=cleaned_text,
         value=level_value,
@@ -987,17 +1118,13 @@ def _perform_level_ocr_from_screenshot(
 
 
 def _perform_zen_ocr_from_screenshot(
-    screenshot_path: Path,
-    debug_path: Path,
-    region_output: Path,
+    screenshot: Path | np.ndarray,
+    debug_path: Path | None,
+    region_output: Path | None,
 ) -> OcrResult | None:
-    if not screenshot_path.exists():
-        LOGGER.error("Zen screenshot not found: %s", screenshot_path)
-        return None
-
-    image = cv2.imread(str(screenshot_path))
+    """Run zen OCR; the debug overlay and region crop are only saved when paths are given."""
+    image = _load_screenshot(screenshot, "Zen")
     if image is None:
-        LOGGER.error("Failed to read zen screenshot: %s", screenshot_path)
         return None
 
     height, width = image.shape[:2]
@@ -1022,42 +1149,30 @@ def _perform_zen_ocr_from_screenshot(
         )
         return None
 
-    debug_image = image.copy()
-    cv2.rectangle(
-        debug_image,
-        (left, top),
-        (max(right - 1, left), max(bottom - 1, top)),
-        (0, 0, 255),
-        2,
-    )
-    debug_path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(debug_path), debug_image)
-    LOGGER.info("Zen debug screenshot saved to %s", debug_path)
+    if debug_path is not None:
+        with _debug_canvas(image) as debug_image:
+            cv2.rectangle(
+                debug_image,
+                (left, top),
+                (max(right - 1, left), max(bottom - 1, top)),
+                (0, 0, 255),
+                2,
+            )
+            _write_image(debug_path, debug_image)
+        LOGGER.info("Zen debug screenshot saved to %s", debug_path)
 
     region = image[top:bottom, left:right]
     if region.size == 0:
         LOGGER.error("Zen OCR region contains no pixels.")
         return None
 
-    region_output.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(region_output), region)
+    if region_output is not None:
+        _write_image(region_output, region)
 
     preprocessed = _preprocess_currency_region(region)
 
-    try:
-        import pytesseract  # type: ignore[import]
-        from PIL import Image  # type: ignore[import]
-    except ImportError:
-        LOGGER.error("pytesseract (and Pillow) are required for OCR; reinstall dependencies.")
-        return None
-
-    pil_image = Image.fromarray(preprocessed)
-    try:
-        text = pytesseract.image_to_string(pil_image, config=ZEN_TESSERACT_CONFIG)
-    except pytesseract.TesseractNotFoundError:
-        LOGGER.error(
-            "Tesseract OCR engine is not installed or not on PATH; install it to continue."
-        )
+    text = image_to_text(preprocessed, ZEN_OCR_WHITELIST, psm=SINGLE_WORD_PSM)
+    if text is None:
         return None
 
     cleaned_text = text.strip()
@@ -1075,42 +1190,68 @@ def _perform_zen_ocr_from_screenshot(
     )
 
 
-def _extract_level_value(text: str) -> int | None:
-    match = LEVEL_TEXT_PATTERN.search(text)
-    if not match:
+def _level_digits_fast(text: str) -> str | None:
+    """Return the level digits of plain ``Level: N / 400`` text, or None to defer to the regex."""
+    head, slash, tail = text.partition("/")
+    if not slash or not tail.lstrip().startswith("400"):
         return None
-    try:
-        level_value = int(match.group(1))
-    except ValueError:
+    head = head.rstrip()
+    digits_start = len(head)
+    while digits_start and head[digits_start - 1].isdecimal():
+        digits_start -= 1
+    if digits_start == len(head) or not head[:digits_start].rstrip().lower().endswith("level:"):
         return None
-    if level_value < 0 or level_value > LEVEL_MAX_VALUE:
+    return head[digits_start:]
+
+
+# OCR of an idle character returns the same text cycle after cycle.
+@functools.lru_cache(maxsize=128)
+def _extract_level_value(text: str) -> int | None:
+    digits = _level_digits_fast(text)
+    if digits is None:
+        match = LEVEL_TEXT_PATTERN.search(text)
+        if not match:
+            return None
+        digits = match.group(1)
+    # Both paths yield only decimal digits, so once leading zeros are dropped and overlong
+    # readings rejected by length, int() cannot fail or go negative.
+    digits = digits.lstrip("0") or "0"
+    if len(digits) > _LEVEL_MAX_DIGITS:
+        return None
+    level_value = int(digits)
+    if level_value > LEVEL_MAX_VALUE:
         return None
     return level_value
 
 
+@functools.lru_cache(maxsize=128)
 def _parse_zen_value(text: str) -> int | None:
-    match = ZEN_TEXT_PATTERN.match(text)
-    if not match:
-        return None
-    digits = match.group(1).replace(",", "")
-    try:
-        value = int(digits)
-    except ValueError:
+    stripped = text.strip()
+    digits = stripped.translate(_ZEN_SEPARATORS)
+    # Plain digit groups are the usual OCR output; anything else goes through the regex.
+    if not (stripped[:1].isdigit() and digits.isascii() and digits.isdecimal()):
+        match = ZEN_TEXT_PATTERN.match(text)
+        if not match:
+            return None
+        digits = match.group(1).translate(_ZEN_SEPARATORS)
+    # Only ASCII digits reach int(); once leading zeros are dropped and overlong readings
+    # rejected by length, it cannot fail or go negative.
+    digits = digits.lstrip("0") or "0"
+    if len(digits) > _ZEN_MAX_DIGITS:
         return None
-    if value < 0 or value > ZEN_MAX_VALUE:
+    value = int(digits)
+    if value > ZEN_MAX_VALUE:
         return None
     return value
 
 
 def _build_notification_message(character_name: str) -> str:
-    mention = f"<@{DISCORD_UID}>"
-    return f"{mention} {character_name} has reached level {TEST_LEVEL_PLACEHOLDER} {STAR_EMOJI}"
+    return f"{_MENTION} {character_name} has reached level {TEST_LEVEL_PLACEHOLDER} {STAR_EMOJI}"
 
 
 def _build_notification_issue_message(character_name: str) -> str:
-    mention = f"<@{DISCORD_UID}>"
     return (
-        f"{mention} Routine for character {character_name} has encountered an issue {WARNING_ICON}."
+        f"{_MENTION} Routine for character {character_name} has encountered an issue {WARNING_ICON}."
     )
 
 
@@ -1313,8 +1454,8 @@ def _enter_running_state(stop_event: threading.Event) -> bool:
             return False
 
         LOGGER.info("Checking in-game status (attempt %d/%d)...", attempt + 1, STARTING_MAX_ATTEMPTS)
-        _capture_screenshot_to(RUN_BASE_SCREENSHOT)
-        ingame_found, _, _ = _detect_ingame(RUN_BASE_SCREENSHOT)
+        frame = _capture_frame(RUN_BASE_SCREENSHOT)
+        ingame_found, _, _ = _detect_ingame(frame)
         if ingame_found:
             LOGGER.info("%s Trainer started", ROCKET_EMOJI)
             play_audio(START_SOUND_FILE)
@@ -1333,20 +1474,21 @@ def _enter_running_state(stop_event: threading.Event) -> bool:
 
 
 def _perform_healthcheck_cycle() -> bool:
-    screenshot_path = _capture_screenshot_to(RUN_BASE_SCREENSHOT)
-    ingame_found, _, _ = _detect_ingame(screenshot_path)
+    frame = _capture_frame(RUN_BASE_SCREENSHOT)
+    detections = _detect_all(frame, (INGAME_SEARCH_CONFIG, DIALOG_SEARCH_CONFIG))
+    ingame_found, _, _ = detections[INGAME_SEARCH_CONFIG.label]
     if not ingame_found:
         _send_error_notification(
             "Character seems not to be in game",
-            screenshot_path,
+            frame,
         )
         return False
 
-    dialog_found, _, _ = _detect_dialog(screenshot_path)
+    dialog_found, _, _ = detections[DIALOG_SEARCH_CONFIG.label]
     if dialog_found:
         _send_error_notification(
             "Dialog window opened",
-            screenshot_path,
+            frame,
         )
         return False
 
@@ -1354,99 +1496,80 @@ def _perform_healthcheck_cycle() -> bool:
 
 
 def _perform_level_cycle(previous_level: int | None) -> tuple[bool, int | None]:
-    menu_open = False
-    region_path: Path | None = None
-    for attempt in range(MENU_MAX_RETRIES):
-        _tap_with_delay("C")
-        _capture_screenshot_to(RUN_LEVEL_SCREENSHOT)
-        menu_open, region_path, _ = _detect_character_menu(RUN_LEVEL_SCREENSHOT)
-        if menu_open:
-            break
+    menu_open, frame = _tap_until(
+        "C", _detect_character_menu, True, MENU_MAX_RETRIES, RUN_LEVEL_SCREENSHOT
+    )
     if not menu_open:
-        _send_error_notification("Unable to open character menu for level check", RUN_LEVEL_SCREENSHOT)
+        _send_error_notification("Unable to open character menu for level check", frame)
         return False, previous_level
 
     detected_level: int | None = None
+    # The frame that confirmed the menu is open serves the first attempt; retries recapture.
     for attempt in range(LEVEL_MAX_ATTEMPTS):
-        _capture_screenshot_to(RUN_LEVEL_SCREENSHOT)
+        if attempt:
+            frame = _capture_frame(RUN_LEVEL_SCREENSHOT)
         ocr_result = _perform_level_ocr_from_screenshot(
-            RUN_LEVEL_SCREENSHOT,
-            RUN_LEVEL_DEBUG,
-            RUN_LEVEL_REGION,
+            frame,
+            RUN_LEVEL_DEBUG if DEBUG_ARTIFACTS else None,
+            RUN_LEVEL_REGION if DEBUG_ARTIFACTS else None,
         )
         if ocr_result and ocr_result.value is not None:
             detected_level = ocr_result.value
             break
 
     if detected_level is None:
-        _send_error_notification("Unable to find and parse character level", RUN_LEVEL_SCREENSHOT)
+        _send_error_notification("Unable to find and parse character level", frame)
         return False, previous_level
 
-    if previous_level is not None:
-        if previous_level < 380 <= detected_level:
-            _send_info_notification(f"Character reached level {detected_level}")
-        elif previous_level < 280 <= detected_level:
-            _send_info_notification(f"Character reached level {detected_level}")
-        elif previous_level < 150 <= detected_level:
-            _send_info_notification(f"Character reached level {detected_level}")
-
-    closed = False
-    for attempt in range(MENU_CLOSE_MAX_RETRIES):
-        _tap_with_delay("C")
-        _capture_screenshot_to(RUN_LEVEL_SCREENSHOT)
-        menu_open, _, _ = _detect_character_menu(RUN_LEVEL_SCREENSHOT)
-        if not menu_open:
-            closed = True
-            break
+    if previous_level is not None and any(
+        previous_level < milestone <= detected_level for milestone in LEVEL_MILESTONES
+    ):
+        _send_info_notification(_LEVEL_MILESTONE_MESSAGE(detected_level))
+
+    closed, frame = _tap_until(
+        "C", _detect_character_menu, False, MENU_CLOSE_MAX_RETRIES, RUN_LEVEL_SCREENSHOT
+    )
     if not closed:
-        _send_error_notification("Unable to close character menu after level check", RUN_LEVEL_SCREENSHOT)
+        _send_error_notification("Unable to close character menu after level check", frame)
         return False, detected_level
 
     return True, detected_level
 
 
 def _perform_zen_cycle() -> bool:
-    inventory_open = False
-    region_path: Path | None = None
-    for attempt in range(MENU_MAX_RETRIES):
-        _tap_with_delay("I")
-        _capture_screenshot_to(RUN_INVENTORY_SCREENSHOT)
-        inventory_open, region_path, _ = _detect_inventory(RUN_INVENTORY_SCREENSHOT)
-        if inventory_open:
-            break
+    inventory_open, frame = _tap_until(
+        "I", _detect_inventory, True, MENU_MAX_RETRIES, RUN_INVENTORY_SCREENSHOT
+    )
     if not inventory_open:
-        _send_error_notification("Unable to open inventory for zen check", RUN_INVENTORY_SCREENSHOT)
+        _send_error_notification("Unable to open inventory for zen check", frame)
         return False
 
     detected_zen: int | None = None
+    # The frame that confirmed the menu is open serves the first attempt; retries recapture.
     for attempt in range(ZEN_MAX_ATTEMPTS):
-        _capture_screenshot_to(RUN_INVENTORY_SCREENSHOT)
+        if attempt:
+            frame = _capture_frame(RUN_INVENTORY_SCREENSHOT)
         ocr_result = _perform_zen_ocr_from_screenshot(
-            RUN_INVENTORY_SCREENSHOT,
-            RUN_ZEN_DEBUG,
-            RUN_ZEN_REGION,
+            frame,
+            RUN_ZEN_DEBUG if DEBUG_ARTIFACTS else None,
+            RUN_ZEN_REGION if DEBUG_ARTIFACTS else None,
         )
         if ocr_result and ocr_result.value is not None:
             detected_zen = ocr_result.value
             break
 
     if detected_zen is None:
-        _send_error_notification("Unable to find and parse zen amount", RUN_INVENTORY_SCREENSHOT)
+        _send_error_notification("Unable to find and parse zen amount", frame)
         return False
 
     if detected_zen > ZEN_THRESHOLD_INFO:
         _send_info_notification("Character zen is reaching maximum value", emoji=COIN_EMOJI)
 
-    closed = False
-    for attempt in range(MENU_CLOSE_MAX_RETRIES):
-        _tap_with_delay("I")
-        _capture_screenshot_to(RUN_INVENTORY_SCREENSHOT)
-        inventory_open, _, _ = _detect_inventory(RUN_INVENTORY_SCREENSHOT)
-        if not inventory_open:
-            closed = True
-            break
+    closed, frame = _tap_until(
+        "I", _detect_inventory, False, MENU_CLOSE_MAX_RETRIES, RUN_INVENTORY_SCREENSHOT
+    )
     if not closed:
-        _send_error_notification("Unable to close inventory after zen check", RUN_INVENTORY_SCREENSHOT)
+        _send_error_notification("Unable to close inventory after zen check", frame)
         return False
 
     return True
@@ -1474,15 +1597,20 @@ def _run_action_loop(stop_event: threading.Event) -> None:
         return
 
     previous_level: int | None = None
+    # Cycles start on a fixed HEALTHCHECK_INTERVAL_SECONDS grid so time spent outside the
+    # cycle itself does not accumulate; an overrunning cycle restarts the grid from now.
+    next_deadline = time.monotonic()
 
     while not stop_event.is_set():
-        cycle_start = time.monotonic()
+        next_deadline += HEALTHCHECK_INTERVAL_SECONDS
         continue_running, previous_level = _perform_running_cycle(previous_level)
         if not continue_running:
             break
 
-        elapsed = time.monotonic() - cycle_start
-        wait_time = max(HEALTHCHECK_INTERVAL_SECONDS - elapsed, 0)
+        now = time.monotonic()
+        if now > next_deadline:
+            next_deadline = now
+        wait_time = next_deadline - now
         LOGGER.info("Waiting %.1fs before next health check...", wait_time)
         if stop_event.wait(wait_time):
             break
@@ -1534,6 +1662,8 @@ def main(argv: list[str] | None = None) -> int:
         return _run_test_screen_size()
 
     _initialize_offset_scaling()
+    preloaded = preload_needles(RUNTIME_NEEDLES)
+    LOGGER.debug("Preloaded %d needle images.", len(preloaded))
 
     stop_event = threading.Event()
     _register_signal_handlers(stop_event)
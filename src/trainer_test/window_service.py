@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import ctypes
 import logging
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from typing import Optional
 
 LOGGER = logging.getLogger(__name__)
@@ -14,6 +15,14 @@ EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_vo
 EnumWindows.argtypes = [EnumWindowsProc, ctypes.c_void_p]
 EnumWindows.restype = ctypes.c_bool
 
+FindWindow = user32.FindWindowW
+FindWindow.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
+FindWindow.restype = ctypes.c_void_p
+
+IsWindow = user32.IsWindow
+IsWindow.argtypes = [ctypes.c_void_p]
+IsWindow.restype = ctypes.c_bool
+
 IsWindowVisible = user32.IsWindowVisible
 IsWindowVisible.argtypes = [ctypes.c_void_p]
 IsWindowVisible.restype = ctypes.c_bool
@@ -92,6 +101,57 @@ def _get_window_bounds(hwnd: int) -> tuple[int, int, int, int]:
     return rect[0], rect[1], rect[2], rect[3]
 
 
+def _title_matches(title: str, search_term: str, match_mode: str) -> bool:
+    haystack = title.lower()
+    if match_mode == "prefix":
+        return haystack.startswith(search_term)
+    return search_term in haystack
+
+
+def _window_info(hwnd: int, title: str) -> WindowInfo:
+    left, top, right, bottom = _get_window_bounds(hwnd)
+    return WindowInfo(handle=int(hwnd), title=title, left=left, top=top, right=right, bottom=bottom)
+
+
+# EnumWindows callback state. The WINFUNCTYPE trampoline is built once at import instead of
+# per search, so searches are serialized through `_enum_lock`.
+_enum_lock = threading.Lock()
+_enum_search: tuple[str, str] = ("", "substring")
+_enum_found: list[WindowInfo] = []
+# Last match per (search term, match mode); revalidated with IsWindow before reuse, or looked
+# up again by its exact title with FindWindowW when the handle has gone away.
+_last_matches: dict[tuple[str, str], WindowInfo] = {}
+
+
+def _enum_callback(hwnd, _lparam):
+    if not IsWindowVisible(hwnd):
+        return True
+
+    title = _get_window_title(hwnd)
+    if not title:
+        return True
+
+    search_term, match_mode = _enum_search
+    if _title_matches(title, search_term, match_mode):
+        _enum_found.append(_window_info(hwnd, title))
+        return False  # stop enumeration
+    return True  # continue searching
+
+
+_ENUM_CALLBACK = EnumWindowsProc(_enum_callback)
+
+
+def _revalidate(info: WindowInfo, search_term: str, match_mode: str) -> Optional[WindowInfo]:
+    """Return a refreshed copy of a cached match, or None if it no longer qualifies."""
+    hwnd = info.handle
+    if not IsWindow(ctypes.c_void_p(hwnd)) or not IsWindowVisible(ctypes.c_void_p(hwnd)):
+        return None
+    title = _get_window_title(hwnd)
+    if not title or not _title_matches(title, search_term, match_mode):
+        return None
+    return _window_info(hwnd, title)
+
+
 def find_window_info(
     partial_title: str,
     *,
@@ -103,7 +163,11 @@ def find_window_info(
     match_mode:
         - "substring": title contains the partial text (default)
         - "prefix": title starts with the partial text
+
+    A previous match for the same search is reused (with fresh bounds) while its window
+    still exists, is visible and still matches; otherwise all windows are enumerated.
     """
+    global _enum_search
 
     if not partial_title:
         raise ValueError("partial_title must be a non-empty string")
@@ -117,53 +181,43 @@ def find_window_info(
         partial_title,
     )
     search_term = partial_title.lower()
-    found: list[WindowInfo] = []
-
-    def _callback(hwnd, _lparam):
-        if not IsWindowVisible(hwnd):
-            return True
-
-        title = _get_window_title(hwnd)
-        if not title:
-            return True
-
-        haystack = title.lower()
-        if (
-            match_mode == "substring"
-            and search_term in haystack
-            or match_mode == "prefix"
-            and haystack.startswith(search_term)
-        ):
-            left, top, right, bottom = _get_window_bounds(hwnd)
-            info = WindowInfo(
-                handle=int(hwnd),
-                title=title,
-                left=left,
-                top=top,
-                right=right,
-                bottom=bottom,
-            )
-            found.append(info)
-            LOGGER.info(
-                "Window match: '%s' handle=%s bounds=(%d,%d,%d,%d)",
-                title,
-                hex(info.handle),
-                left,
-                top,
-                right,
-                bottom,
-            )
-            return False  # stop enumeration
-        return True  # continue searching
-
-    EnumWindows(EnumWindowsProc(_callback), 0)
-
-    if not found:
+    key = (search_term, match_mode)
+    with _enum_lock:
+        cached = _last_matches.get(key)
+        if cached is not None:
+            info = _revalidate(cached, search_term, match_mode)
+            if info is None:
+                hwnd = FindWindow(None, cached.title)
+                if hwnd:
+                    info = _revalidate(replace(cached, handle=int(hwnd)), search_term, match_mode)
+            if info is not None:
+                _last_matches[key] = info
+                return info
+            del _last_matches[key]
+
+        _enum_search = key
+        _enum_found.clear()
+        EnumWindows(_ENUM_CALLBACK, 0)
+        info = _enum_found[0] if _enum_found else None
+        _enum_found.clear()
+        if info is not None:
+            _last_matches[key] = info
+
+    if info is None:
         if log_missing:
             LOGGER.warning("No window found containing '%s'.", partial_title)
         return None
 
-    return found[0]
+    LOGGER.info(
+        "Window match: '%s' handle=%s bounds=(%d,%d,%d,%d)",
+        info.title,
+        hex(info.handle),
+        info.left,
+        info.top,
+        info.right,
+        info.bottom,
+    )
+    return info
 
 
 def focus_window(hwnd: int) -> bool:
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from trainer_test import image_service
+
+VISION_DIR = Path(__file__).resolve().parent.parent / "vision"
+NEEDLES = ["dialog_needle.png", "ingame_needle.png", "inventory_needle.PNG", "character_needle.PNG"]
+THRESHOLD = 0.78
+
+TRANSFORMS = {
+    "unchanged": lambda needle: needle,
+    "dimmed": lambda needle: (needle * 0.7).astype(np.uint8),
+    "darker": lambda needle: np.clip(needle.astype(np.int16) - 30, 0, 255).astype(np.uint8),
+    "brighter": lambda needle: np.clip(needle.astype(np.int16) + 60, 0, 255).astype(np.uint8),
+}
+
+
+def _load_needle(name: str) -> np.ndarray:
+    needle = cv2.imread(str(VISION_DIR / name), cv2.IMREAD_GRAYSCALE)
+    assert needle is not None, name
+    return needle
+
+
+def _haystack(rng: np.random.Generator, size: int, dark: bool) -> np.ndarray:
+    high = 50 if dark else 256
+    noise = rng.integers(0, high, (size, size)).astype(np.uint8)
+    return cv2.GaussianBlur(noise, (5, 5), 0)
+
+
+def _paste(haystack: np.ndarray, patch: np.ndarray, rng: np.random.Generator) -> tuple[int, int]:
+    height, width = patch.shape
+    y = int(rng.integers(0, haystack.shape[0] - height))
+    x = int(rng.integers(0, haystack.shape[1] - width))
+    haystack[y : y + height, x : x + width] = patch
+    return x, y
+
+
+def _baseline(haystack: np.ndarray, needle: np.ndarray) -> tuple[float, tuple[int, int]]:
+    """Single full-resolution TM_CCOEFF_NORMED search, the behaviour the matcher must keep."""
+    scores = cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED)
+    _, best, _, location = cv2.minMaxLoc(scores)
+    return best, location
+
+
+# 300 covers the single full-resolution search, 800 the pyramid path.
+@pytest.mark.parametrize("size", [300, 800])
+@pytest.mark.parametrize("dark", [True, False], ids=["dark", "noisy"])
+@pytest.mark.parametrize("transform", sorted(TRANSFORMS))
+@pytest.mark.parametrize("name", NEEDLES)
+def test_shifted_needle_found_at_baseline_confidence(name, transform, dark, size):
+    needle = _load_needle(name)
+    rng = np.random.default_rng(sorted(TRANSFORMS).index(transform) * 10 + dark)
+    for _ in range(10):
+        haystack = _haystack(rng, size, dark)
+        location = _paste(haystack, TRANSFORMS[transform](needle), rng)
+        baseline_score, baseline_location = _baseline(haystack, needle)
+        assert baseline_score >= THRESHOLD and baseline_location == location
+
+        match = image_service.find_image_array(needle, haystack, match_threshold=THRESHOLD)
+
+        assert match is not None
+        assert (match["top_left_x"], match["top_left_y"]) == location
+        assert match["confidence"] == pytest.approx(baseline_score, abs=1e-3)
+
+
+def test_path_and_array_haystacks_agree(tmp_path):
+    needle_path = VISION_DIR / "dialog_needle.png"
+    needle = _load_needle(needle_path.name)
+    rng = np.random.default_rng(7)
+    haystack = _haystack(rng, 300, dark=True)
+    location = _paste(haystack, TRANSFORMS["brighter"](needle), rng)
+    haystack_path = tmp_path / "haystack.png"
+    cv2.imwrite(str(haystack_path), haystack)
+
+    from_array = image_service.find_image(needle_path, haystack, annotate=False)
+    from_path = image_service.find_image(needle_path, haystack_path, annotate=False)
+
+    assert from_array is not None and from_path is not None
+    for match in (from_array, from_path):
+        assert (match["top_left_x"], match["top_left_y"]) == location
+    assert from_array["confidence"] == pytest.approx(from_path["confidence"])
+
+
+def test_absent_needle_is_not_reported():
+    needle = _load_needle("ingame_needle.png")
+    haystack = _haystack(np.random.default_rng(3), 300, dark=False)
+
+    assert image_service.find_image_array(needle, haystack, match_threshold=THRESHOLD) is None
+
+
+def test_center_region_match_uses_crop_coordinates():
+    needle = _load_needle("inventory_needle.PNG")
+    rng = np.random.default_rng(11)
+    screenshot = cv2.cvtColor(_haystack(rng, 400, dark=True), cv2.COLOR_GRAY2BGR)
+    height, width = needle.shape
+    top, left = 200 - height // 2 + 5, 200 - width // 2 - 7
+    screenshot[top : top + height, left : left + width] = cv2.cvtColor(
+        TRANSFORMS["brighter"](needle), cv2.COLOR_GRAY2BGR
+    )
+
+    match = image_service.find_image_in_center_region(
+        VISION_DIR / "inventory_needle.PNG", screenshot, 200, 200
+    )
+
+    assert match is not None
+    assert (match["top_left_x"], match["top_left_y"]) == (left - 100, top - 100)
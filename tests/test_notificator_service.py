@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import socket
+import threading
+
+import pytest
+
+from trainer_test import notificator_service
+
+
+def _read_request(connection: socket.socket) -> tuple[int, bytes]:
+    """Read one HTTP request and return (declared Content-Length, body received)."""
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return 0, b""
+        data += chunk
+    head, body = data.split(b"\r\n\r\n", 1)
+    length = 0
+    for line in head.split(b"\r\n"):
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    connection.settimeout(1)
+    try:
+        while len(body) < length:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            body += chunk
+    except socket.timeout:
+        pass
+    return length, body
+
+
+@pytest.fixture
+def flaky_server():
+    """Server that drops the first connection after reading it and answers the second."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    requests: list[tuple[int, bytes]] = []
+
+    def serve() -> None:
+        connection, _ = server.accept()
+        requests.append(_read_request(connection))
+        connection.close()
+
+        connection, _ = server.accept()
+        length, body = _read_request(connection)
+        requests.append((length, body))
+        status = b"204 No Content" if len(body) == length else b"400 Bad Request"
+        connection.sendall(b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\n\r\n")
+        connection.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.getsockname()[1]}/webhook", requests
+    thread.join(timeout=5)
+    server.close()
+    notificator_service._connections.clear()
+
+
+def test_retry_resends_mapped_attachment(flaky_server, tmp_path):
+    url, requests = flaky_server
+    attachment = tmp_path / "report.bin"
+    contents = bytes(range(256)) * 80
+    attachment.write_bytes(contents)
+
+    assert notificator_service.send_discord_notification(url, "hello", file_path=attachment, timeout=5)
+
+    assert len(requests) == 2
+    first, second = requests
+    assert first == second
+    assert len(second[1]) == second[0]
+    assert contents in second[1]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from trainer_test import trainer
+
+
+@pytest.fixture(autouse=True)
+def _clear_parse_caches():
+    trainer._extract_level_value.cache_clear()
+    trainer._parse_zen_value.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Level: 350 / 400", 350),
+        ("Level:350/400", 350),
+        ("level: 7 /400", 7),
+        ("Level: 400 / 400", 400),
+        ("Level: 0400 / 400", 400),
+        ("Level: 401 / 400", None),
+        ("Level: 12345 / 400", None),
+        ("Level: " + "9" * 5000 + " / 400", None),
+        ("Level: " + "0" * 5000 + "5 / 400", 5),
+        ("Level: 000 / 400", 0),
+        ("Level: / 400", None),
+        ("350 / 400", None),
+        ("", None),
+    ],
+)
+def test_extract_level_value(text, expected):
+    assert trainer._extract_level_value(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("1,234,567", 1_234_567),
+        (" 98765 ", 98_765),
+        ("0", 0),
+        ("2,000,000,000", 2_000_000_000),
+        ("002,000,000,000", 2_000_000_000),
+        ("2,000,000,001", None),
+        ("9" * 5000, None),
+        ("0" * 5000 + "5", 5),
+        ("0" * 5000 + "9" * 11, None),
+        ("000", 0),
+        ("12a34", None),
+        (",123", None),
+        ("1.234", None),
+        ("", None),
+    ],
+)
+def test_parse_zen_value(text, expected):
+    assert trainer._parse_zen_value(text) == expected
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def menu(monkeypatch):
+    """Drive _tap_until with a fake clock, recorded key presses and numbered frames."""
+    clock = _FakeClock()
+    taps: list[tuple[str, float]] = []
+    frames: list[np.ndarray] = []
+
+    def capture(_debug_path):
+        frames.append(np.full((1, 1), len(frames), dtype=np.uint8))
+        return frames[-1]
+
+    monkeypatch.setattr(trainer, "time", clock)
+    monkeypatch.setattr(trainer, "_tap_with_delay", lambda key, delay: taps.append((key, delay)))
+    monkeypatch.setattr(trainer, "_capture_frame", capture)
+    return clock, taps, frames
+
+
+def _detector(states):
+    states = iter(states)
+    return lambda frame: (next(states), None, None)
+
+
+def test_tap_until_polls_without_pressing_again(menu):
+    _clock, taps, frames = menu
+
+    reached, frame = trainer._tap_until(
+        "C", _detector([False, False, True]), True, 3, trainer.RUN_LEVEL_SCREENSHOT
+    )
+
+    assert reached
+    assert taps == [("C", trainer.MENU_TAP_DELAY_SECONDS)]
+    assert frame is frames[2]
+
+
+def test_tap_until_presses_again_after_poll_timeout(menu):
+    _clock, taps, frames = menu
+    polls = int(trainer.MENU_POLL_TIMEOUT_SECONDS / trainer.MENU_POLL_INTERVAL_SECONDS) + 1
+
+    reached, frame = trainer._tap_until(
+        "I", _detector([True] * polls + [False]), False, 3, trainer.RUN_INVENTORY_SCREENSHOT
+    )
+
+    assert reached
+    assert [key for key, _ in taps] == ["I", "I"]
+    assert len(frames) == polls + 1
+    assert frame is frames[-1]
+
+
+def test_tap_until_gives_up_after_attempts(menu):
+    clock, taps, frames = menu
+
+    reached, frame = trainer._tap_until(
+        "C", lambda frame: (False, None, None), True, 2, trainer.RUN_LEVEL_SCREENSHOT
+    )
+
+    assert not reached
+    assert len(taps) == 2
+    assert frame is frames[-1]
+    assert clock.now >= 2 * trainer.MENU_POLL_TIMEOUT_SECONDS
+
+
+@pytest.mark.parametrize("delay", [trainer.MENU_TAP_DELAY_SECONDS, 2.0])
+def test_tap_with_delay_jitter_stays_proportional(monkeypatch, delay):
+    sleeps: list[float] = []
+    monkeypatch.setattr(trainer, "tap", lambda key: None)
+    monkeypatch.setattr(trainer.time, "sleep", sleeps.append)
+
+    for _ in range(200):
+        trainer._tap_with_delay("C", delay)
+
+    assert min(sleeps) >= delay * 0.75
+    assert max(sleeps) <= delay * 1.25
+
+
+@pytest.mark.parametrize("invert", [False, True])
+def test_level_preprocessing_stays_binary(invert):
+    rng = np.random.default_rng(5)
+    region = rng.integers(0, 256, (24, 90, 3), dtype=np.uint8)
+
+    processed = trainer._preprocess_level_region(region, invert=invert)
+
+    assert processed.shape == (24 * trainer.LEVEL_UPSCALE_FACTOR, 90 * trainer.LEVEL_UPSCALE_FACTOR)
+    assert set(np.unique(processed)) <= {0, 255}